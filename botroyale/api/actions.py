@@ -31,6 +31,8 @@ REGEN_AP: int = 50
 class Action:
     """Base class for all Actions. Not to be used directly."""
 
+    __slots__ = ()
+
     ap: int = 0
     """The AP cost of the action."""
 
@@ -42,6 +44,8 @@ class Action:
 class Move(Action):
     """See module documenation for details."""
 
+    __slots__ = ("target",)
+
     ap = 20
 
     def __init__(self, target_tile: Hexagon):
@@ -61,18 +65,35 @@ class Move(Action):
 class Push(Move):
     """See module documenation for details."""
 
+    __slots__ = ()
+
     ap = 30
 
 
 class Jump(Move):
     """See module documenation for details."""
 
+    __slots__ = ()
+
     ap = 45
 
 
 class Idle(Action):
     """See module documenation for details."""
 
+    __slots__ = ()
+
+    def __new__(cls):
+        """Idle carries no state, so all instances are the same object."""
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
+
+    def __reduce__(self):
+        """Reconstruct through `Idle.__new__`, such that copies are the same object."""
+        return self.__class__, ()
+
 
 ALL_ACTIONS: tuple[Action, ...] = (Idle, Move, Push, Jump)
 """A tuple of all the Actions."""
@@ -52,6 +52,7 @@ from importlib import import_module
 from botroyale.util import PACKAGE_DIR
 from botroyale.util.hexagon import Hexagon, ORIGIN
 from botroyale.api.logging import logger as glogger
+from botroyale.api.gui import CLICK_MARKS, DEFAULT_CLICK_MARK
 from botroyale.api.actions import Action, Idle
 from botroyale.logic.state import State
 
@@ -65,9 +66,13 @@ CENTER: Hexagon = ORIGIN
 """Map center. Alias for `botroyale.util.hexagon.ORIGIN`."""
 
 
+# Bound once, as center_distance is called per tile by many bots
+_center_get_distance = ORIGIN.get_distance
+
+
 def center_distance(hex: Hexagon) -> int:
     """Returns distance of *hex* from the `CENTER`."""
-    return ORIGIN.get_distance(hex)
+    return _center_get_distance(hex)
 
 
 # BOT CLASS
@@ -135,8 +140,8 @@ class BaseBot:
             None, or a list of dictionaries of vfx keyword arguments.
                 See `botroyale.api.gui.VFX`.
         """
-        vfx = {"left": "green", "right": "red"}.get(button, "blue")
-        return [{"name": f"mark-{vfx}", "hex": hex}]
+        vfx = CLICK_MARKS.get(button, DEFAULT_CLICK_MARK)
+        return [{"name": vfx, "hex": hex}]
 
     def logger(self, text: str):
         """Logger for the bot.
@@ -237,10 +242,8 @@ class BotSelection:
             max_repeat=self.max_repeat,
         )
         # Convert to classes
-        bot_classes = []
-        for bot_name in selected_bots:
-            bot_classes.append(BOTS[bot_name])
-        random.shuffle(bot_classes)
+        random.shuffle(selected_bots)
+        bot_classes = [BOTS[bot_name] for bot_name in selected_bots]
         assert len(bot_classes) == total_slots
         return bot_classes
 
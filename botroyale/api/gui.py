@@ -12,10 +12,11 @@ from typing import (
     Mapping,
     Any,
     Callable,
+    NamedTuple,
     get_args as get_type_args,
 )
 from collections import deque
-from dataclasses import dataclass, asdict as dataclass_asdict
+from dataclasses import dataclass
 from botroyale.util.hexagon import Hexagon, ORIGIN
 from botroyale.api.logging import logger as glogger
 
@@ -74,6 +75,9 @@ INPUT_WIDGET_TYPES = get_type_args(InputWidgetType)
 WidgetValues = Mapping[str, Any]
 """A dictionary that maps an `InputWidget.sendto` name to a value."""
 
+# Defaults for `InputWidget` types that do not depend on the widget's arguments
+_WIDGET_DEFAULTS = {"toggle": False, "text": "", "slider": 0.0}
+
 MenuUpdate = Literal[
     "nothing",
     "values",
@@ -131,20 +135,15 @@ class InputWidget:
             self.sendto = self.label
 
         if self.default is None:
-            if self.type == "toggle":
-                self.default = False
-            elif self.type == "text":
-                self.default = ""
-            elif self.type in {"spacer", "divider"}:
+            if self.type in {"spacer", "divider"}:
                 self.default = self.label
             elif self.type == "select":
                 self.default = self.options[0]
-            elif self.type == "slider":
-                self.default = 0.0
+            else:
+                self.default = _WIDGET_DEFAULTS[self.type]
 
 
-@dataclass
-class Tile:
+class Tile(NamedTuple):
     """Represents how a hex on the tilemap should be drawn."""
 
     tile: Optional[str] = None
@@ -159,8 +158,7 @@ class Tile:
     """Text to draw on the tile."""
 
 
-@dataclass
-class VFX:
+class VFX(NamedTuple):
     """Represents a visual effect to be drawn on the tilemap."""
 
     name: str
@@ -177,8 +175,22 @@ class VFX:
     """Real-time seconds after which the vfx expires."""
 
     def asdict(self):
-        """Equivalent to passing *self* to `dataclasses.dataclass_asdict`."""
-        return dataclass_asdict(self)
+        """A dictionary mapping field names to their values."""
+        return self._asdict()
+
+
+# Tiles for the default `BattleAPI.get_gui_tile_info`, shared since tiles are
+# immutable and requested for every visible hex on every frame
+_DEFAULT_TILE = Tile(bg=(0.1, 0.1, 0.1), color=(0.25, 0.25, 0.25), sprite="hex")
+_ORIGIN_TILE = Tile(
+    bg=(0.1, 0.1, 0.1), color=(0.25, 0.25, 0.25), sprite="hex", text="Origin"
+)
+
+
+CLICK_MARKS: dict[str, str] = {"left": "mark-green", "right": "mark-red"}
+"""Names of the vfx used to mark a clicked tile, by mouse button."""
+DEFAULT_CLICK_MARK: str = "mark-blue"
+"""Name of the vfx used to mark a clicked tile for buttons not in `CLICK_MARKS`."""
 
 
 @dataclass
@@ -233,7 +245,7 @@ class BattleAPI:
     def flush_overlays(self) -> list[Overlay]:
         """Clears and returns the overlays from queue."""
         r = list(self.__overlay_queue)
-        self.__overlay_queue = deque()
+        self.__overlay_queue.clear()
         return r
 
     # Info panel
@@ -255,14 +267,11 @@ class BattleAPI:
     def get_gui_tile_info(self, hex: Hexagon) -> Tile:
         """Returns a `Tile` representing how to display *hex* in the GUI.
 
-        Called by the GUI for every hex currently visible on the map.
+        Called by the GUI for every hex currently visible on the map. The GUI
+        does not modify the returned `Tile`, so the same one may be returned
+        for many hexes.
         """
-        return Tile(
-            bg=(0.1, 0.1, 0.1),
-            color=(0.25, 0.25, 0.25),
-            sprite="hex",
-            text="" if hex != ORIGIN else "Origin",
-        )
+        return _DEFAULT_TILE if hex != ORIGIN else _ORIGIN_TILE
 
     def get_map_size_hint(self) -> Union[int, float]:
         """The radius of the map size for the GUI to display."""
@@ -283,12 +292,7 @@ class BattleAPI:
                 - `#` meta ("win" key)
                 - `^+` control + shift
         """
-        if button == "left":
-            vfx = "mark-green"
-        elif button == "right":
-            vfx = "mark-red"
-        else:
-            vfx = "mark-blue"
+        vfx = CLICK_MARKS.get(button, DEFAULT_CLICK_MARK)
         self.add_vfx(vfx, hex)
 
     # VFX
@@ -346,10 +350,10 @@ class BattleAPI:
         if clear_existing:
             self.__clear_vfx_flag = True
 
-    def flush_vfx(self) -> Sequence[VFX]:
+    def flush_vfx(self) -> list[VFX]:
         """Clears and returns the vfx from queue."""
-        r = self.__vfx_queue
-        self.__vfx_queue = deque()
+        r = list(self.__vfx_queue)
+        self.__vfx_queue.clear()
         return r
 
 
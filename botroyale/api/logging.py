@@ -20,10 +20,15 @@ class Logger:
     """Disables logging globally if False."""
 
     @classmethod
-    def log(cls, text: str):
-        """Output text to console if logging is enabled globally."""
+    def log(cls, text: str, *args):
+        """Output text to console if logging is enabled globally.
+
+        If *args* are given, *text* is formatted with them (printf-style) only
+        when logging is enabled. Prefer this over an f-string in code that runs
+        often, as the formatting is skipped entirely when logging is disabled.
+        """
         if cls.enable_logging and GLOBAL_LOGGING:
-            print(text)
+            print(text % args if args else text)
 
     @classmethod
     @contextlib.contextmanager
@@ -44,9 +49,15 @@ class Logger:
         """
         last_state = cls.enable_logging
         cls.enable_logging = enabled
-        yield last_state
-        cls.enable_logging = last_state
+        try:
+            yield last_state
+        finally:
+            cls.enable_logging = last_state
+
+
+def _log_nothing(text: str, *args):
+    pass
 
 
-logger = Logger.log
-"""Alias for `Logger.log`."""
+logger = Logger.log if GLOBAL_LOGGING else _log_nothing
+"""Alias for `Logger.log` (does nothing if logging is permanently disabled)."""
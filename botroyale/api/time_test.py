@@ -1,11 +1,12 @@
 """Tool for measuring calculation time of bots.
 
 The `timing_test` function is a convenient way to quickly measure mean and
-maximum calculation time of bots. Results are logged (printed to console,
-currently) as they are available.
+maximum calculation time of bots. Progress is logged (printed to console,
+currently) as each battle is played, and the results are logged once all
+battles are done.
 """
 from typing import Optional, Sequence, NamedTuple
-import numpy as np
+from dataclasses import dataclass
 from botroyale.api.logging import logger as glogger
 from botroyale.logic.maps import get_map_state
 from botroyale.logic.battle_manager import BattleManager
@@ -22,6 +23,18 @@ class TimeResult(NamedTuple):
     """Max calculation time"""
 
 
+@dataclass
+class _BotTotals:
+    """Running totals of a bot's times over the battles played so far."""
+
+    mean_sum: float = 0.0
+    """Sum of the mean calculation time of each battle."""
+    count: int = 0
+    """Number of battles played."""
+    max_time: float = 0.0
+    """Max calculation time of all battles."""
+
+
 def timing_test(
     bots: Sequence[str],
     battle_count: int,
@@ -49,7 +62,7 @@ def timing_test(
     """
     bots = [b for b in bots if BOTS[b].NAME != "dummy"]
     battle_index = 0
-    all_results = {b: TimeResult([], []) for b in bots}
+    all_results = {b: _BotTotals() for b in bots}
 
     glogger("\n\n========== Timing Test ==========")
     glogger("Selected:\n" + "\n".join(f"{i:>2} {b}" for i, b in enumerate(bots)))
@@ -71,24 +84,22 @@ def timing_test(
         for uid, bot in enumerate(battle.bots):
             if type(bot) is DummyBot:
                 continue
-            all_results[bot.NAME].mean.append(battle.bot_timer.mean(uid))
-            all_results[bot.NAME].max.append(battle.bot_timer.max(uid))
-        _print_final_results(
-            _get_final_results(all_results),
-            battle_index,
-            battle_count,
-        )
+            totals = all_results[bot.NAME]
+            totals.mean_sum += battle.bot_timer.mean(uid)
+            totals.count += 1
+            totals.max_time = max(totals.max_time, battle.bot_timer.max(uid))
 
     final_results = _get_final_results(all_results)
+    _print_final_results(final_results, battle_index, battle_count)
     return final_results
 
 
 def _get_final_results(results):
     final_results = {}
-    for bot_name, result in results.items():
+    for bot_name, totals in results.items():
         final_results[bot_name] = TimeResult(
-            mean=np.mean(np.asarray(result.mean)),
-            max=np.max(np.asarray(result.max)),
+            mean=totals.mean_sum / totals.count,
+            max=totals.max_time,
         )
     return final_results
 
@@ -108,9 +119,11 @@ def _print_final_results(results, battle_index, battle_count):
             ]
         )
     )
-    for bot_name, result in results.items():
-        glogger(
-            f'{bot_name:<20}    Mean: {f"{result.mean:.3f}":>12} ms/t      '
-            f'Max: {f"{result.max:.3f}":>14} ms'
+    glogger(
+        "\n".join(
+            f"{bot_name:<20}    Mean: {result.mean:>12.3f} ms/t      "
+            f"Max: {result.max:>14.3f} ms"
+            for bot_name, result in results.items()
         )
+    )
     glogger("\n_________________________________________")
@@ -5,6 +5,7 @@ The relevant modules for bot developers include `botroyale.logic.state` and
 """
 from typing import Optional
 from enum import IntEnum, auto as enum_auto
+import functools
 from botroyale.util import settings
 from botroyale.util.hexagon import ORIGIN, Hexagon
 
@@ -87,6 +88,7 @@ def get_tile_info_unit(
     unit_sprites: Optional[list[str]] = None,
     unit_colors: Optional[list[tuple[float, float, float]]] = None,
     disallow_double: bool = True,
+    unit_index: Optional[dict[Hexagon, list[int]]] = None,
 ) -> tuple[str, tuple[float, float, float], str]:
     """Get a tile's foreground (unit) sprite, color, and text.
 
@@ -98,6 +100,9 @@ def get_tile_info_unit(
         disallow_double: If true, will show a special sprite/color if more than
             one unit was found. I.e. show the "error" sprite if the tile
             contains more than one unit.
+        unit_index: The result of `get_unit_index` for *state*. Recommended
+            when calling for many tiles of the same state, to avoid searching
+            the positions for every tile.
 
     Returns:
         A (sprite, color, text) tuple.
@@ -105,14 +110,18 @@ def get_tile_info_unit(
     sprite = None
     color = None
     text = None
-    unit_count = state.positions.count(hex)
+    if unit_index is None:
+        uids = [uid for uid, pos in enumerate(state.positions) if pos == hex]
+    else:
+        uids = unit_index.get(hex, ())
+    unit_count = len(uids)
     if unit_count > 1 and disallow_double:
         sprite = "error"
         color = 1, 1, 1
     elif unit_count == 1:
         if unit_colors is None:
             unit_colors = UNIT_COLORS
-        uid = state.positions.index(hex)
+        uid = uids[0]
         alive = state.alive_mask[uid]
         color = unit_colors[uid % len(unit_colors)] if alive else (0.5, 0.5, 0.5)
         if unit_sprites is None:
@@ -121,3 +130,26 @@ def get_tile_info_unit(
             sprite = unit_sprites[uid % len(unit_sprites)]
         text = str(uid)
     return sprite, color, text
+
+
+@functools.lru_cache(maxsize=4096)
+def get_tile_info_coords(hex: Hexagon) -> str:
+    """Get a tile's coordinates text.
+
+    Cached, as it is requested for every tile on every frame while coordinates
+    are shown. The cache is bounded since the tilemap may be panned anywhere.
+    """
+    return f"{hex.x},{hex.y}"
+
+
+def get_unit_index(
+    state: "logic.state.State",  # noqa  (get F821 error for undefined name)
+) -> dict[Hexagon, list[int]]:
+    """Map each occupied hex in *state* to the uids positioned on it.
+
+    See: `get_tile_info_unit`.
+    """
+    unit_index = {}
+    for uid, hex in enumerate(state.positions):
+        unit_index.setdefault(hex, []).append(uid)
+    return unit_index
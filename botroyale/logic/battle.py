@@ -146,22 +146,22 @@ class Battle:
         self.log_state(state)
         if state.end_of_round:
             new_state = state.increment_round()
-            self.logger(f"Death radius: {new_state.death_radius}")
+            self.logger("Death radius: %s", new_state.death_radius)
         else:
             unit_id = state.current_unit
             action = self._get_bot_action(unit_id, state)
             if action is not None:
                 # Bot returned an action, apply.
-                self.logger(f"Applying {action} to state")
+                self.logger("Applying %s to state", action)
                 if self.__only_bot_turn_states:
                     new_state = state.apply_action(action)
                 else:
                     new_state = state.apply_action_manual(action)
                     if not new_state.is_last_action_legal:
-                        self.logger(f"ILLEGAL: {action}")
+                        self.logger("ILLEGAL: %s", action)
             else:
                 # Bot failed to return an action, kill.
-                self.logger(f"Killing {self.bots[unit_id]}...")
+                self.logger("Killing %s...", self.bots[unit_id])
                 if self.__only_bot_turn_states:
                     new_state = state.apply_kill_unit()
                 else:
@@ -196,13 +196,16 @@ class Battle:
         if print_progress:
             disable_logging = True
             print_progress_bar()
-        last_rc = self.state.round_count
         with Logger.set_logging_temp(not disable_logging):
-            while not self.state.game_over:
-                last_rc = self.state.round_count
-                self.play_state()
-                if print_progress and self.state.round_count > last_rc:
-                    print_progress_bar()
+            if not print_progress:
+                while not self.state.game_over:
+                    self.play_state()
+            else:
+                while not self.state.game_over:
+                    last_rc = self.state.round_count
+                    self.play_state()
+                    if self.state.round_count > last_rc:
+                        print_progress_bar()
         if print_progress:
             print("")
 
@@ -234,7 +237,7 @@ class Battle:
                 self.logger(f"CRASH {bot}: {e}\n\n{formatted_exc}")
                 return None
         self.logger(LINEBR)
-        self.logger(f"Received action: {action}")
+        self.logger("Received action: %s", action)
         ttime = self.bot_timer.get_time(unit_id)
         if ttime > self.__threshold_bot_block_ms:
             self.logger(
@@ -244,13 +247,15 @@ class Battle:
         return action
 
     # Logging
-    def logger(self, text: str):
-        """Logger for the battle."""
+    def logger(self, text: str, *args):
+        """Logger for the battle. See `botroyale.api.logging.Logger.log`."""
         if self.enable_logging:
-            glogger(text)
+            glogger(text, *args)
 
     def log_state(self, state: State):
         """Log a quick summary of the current state."""
+        if not self.enable_logging:
+            return
         self.logger(
             "\n".join(
                 [
@@ -1,12 +1,25 @@
 """Home of `botroyale.logic.battle_manager.BattleManager`."""
 from typing import Optional, Literal, Callable
 from botroyale.logic.battle import Battle
-from botroyale.api.gui import BattleAPI, Tile, Control
+from botroyale.api.gui import (
+    BattleAPI,
+    Tile,
+    Control,
+    CLICK_MARKS,
+    DEFAULT_CLICK_MARK,
+)
 from botroyale.util.time import ping, pong
 from botroyale.util import settings
 from botroyale.util.hexagon import Hex, Hexagon
 from botroyale.logic.state import State
-from botroyale.logic import UNIT_COLORS, get_tile_info, get_tile_info_unit
+from botroyale.logic import (
+    UNIT_COLORS,
+    DEFAULT_CELL_BG,
+    get_tile_info,
+    get_tile_info_unit,
+    get_tile_info_coords,
+    get_unit_index,
+)
 
 
 STEP_RATE = settings.get("battle.default_step_rate")
@@ -14,6 +27,8 @@ STEP_RATES = settings.get("battle.toggle_step_rates")
 LOGIC_DEBUG = settings.get("logging.battle")
 BOT_CALC_DISCLAIMER = "This may take a while, depending on the map and bots."
 MAP_CENTER = Hex(0, 0)
+# Shared by all empty floor tiles, which are the majority of the tilemap
+_EMPTY_TILE = Tile(tile="hex", bg=tuple(DEFAULT_CELL_BG), color=None)
 
 
 PanelMode = Literal["turns", "timers"]
@@ -54,6 +69,10 @@ class BattleManager(Battle, BattleAPI):
         ]
         self.unit_sprites = [bot.SPRITE for bot in self.bots]
         self.__panel_mode: PanelMode = "turns"
+        self.__unit_index_state: Optional[State] = None
+        self.__unit_index: dict[Hexagon, list[int]] = {}
+        self.__info_panel_key: Optional[tuple] = None
+        self.__info_panel_text: str = ""
 
     # Replay
     def set_replay_index(
@@ -393,9 +412,10 @@ class BattleManager(Battle, BattleAPI):
 
         Overrides: `botroyale.api.gui.BattleAPI.update`.
         """
+        if not self.autoplay:
+            return
         if self.replay_state.game_over:
             self.autoplay = False
-        if not self.autoplay:
             return
         time_delta = pong(self.__last_step)
         if time_delta >= self.step_interval_ms:
@@ -501,7 +521,18 @@ class BattleManager(Battle, BattleAPI):
         Returns:
             Return value of `BattleManager.get_info_str`.
         """
-        return self.get_info_str(self.replay_index)
+        # Called every frame, rebuild only when something shown has changed
+        key = (
+            self.replay_index,
+            self.history_size,
+            self.autoplay,
+            self.step_interval_ms,
+            self.__panel_mode,
+        )
+        if key != self.__info_panel_key:
+            self.__info_panel_key = key
+            self.__info_panel_text = self.get_info_str(self.replay_index)
+        return self.__info_panel_text
 
     def get_info_panel_color(self) -> str:
         """Changes color depending on `BattleManager.replay_mode`.
@@ -519,6 +550,10 @@ class BattleManager(Battle, BattleAPI):
         Overrides: `botroyale.api.gui.BattleAPI.get_gui_tile_info`.
         """
         state = self.replay_state
+        # Index the units once per state rather than searching for every hex
+        if state is not self.__unit_index_state:
+            self.__unit_index_state = state
+            self.__unit_index = get_unit_index(state)
 
         tile, bg = get_tile_info(hex, state)
         sprite, color, text = get_tile_info_unit(
@@ -526,10 +561,13 @@ class BattleManager(Battle, BattleAPI):
             state,
             self.unit_sprites,
             self.unit_colors,
+            unit_index=self.__unit_index,
         )
 
         if self.show_coords:
-            text = f"{hex.x},{hex.y}"
+            text = get_tile_info_coords(hex)
+        elif sprite is None and tile == "hex" and bg == DEFAULT_CELL_BG:
+            return _EMPTY_TILE
 
         return Tile(
             tile=tile,
@@ -554,8 +592,7 @@ class BattleManager(Battle, BattleAPI):
 
         Overrides: `botroyale.api.gui.BattleAPI.handle_hex_click`.
         """
-        click = f"{mods} {button}"
-        self.logger(f"Clicked {click} on: {hex}")
+        self.logger("Clicked %s %s on: %s", mods, button, hex)
         # Normal click and Control click: info
         if mods == "" or mods == "^":
             if button == "left":
@@ -566,8 +603,8 @@ class BattleManager(Battle, BattleAPI):
                         self.add_vfx("highlight", t, steps=1)
         # Shift click: mark
         elif mods == "+":
-            vfx = {"left": "green", "right": "red"}.get(button, "blue")
-            self.add_vfx(f"mark-{vfx}", hex, steps=1)
+            vfx = CLICK_MARKS.get(button, DEFAULT_CLICK_MARK)
+            self.add_vfx(vfx, hex, steps=1)
         # Alt click: bot debug
         elif mods == "!":
             if hex in self.replay_state.positions:
@@ -9,7 +9,12 @@ from botroyale.api.gui import (
     Tile,
     Control,
 )
-from botroyale.logic import get_tile_info, get_tile_info_unit, PLATE_RESET_COLOR
+from botroyale.logic import (
+    get_tile_info,
+    get_tile_info_unit,
+    get_tile_info_coords,
+    PLATE_RESET_COLOR,
+)
 
 
 __pdoc__ = {}
@@ -272,7 +277,7 @@ class MapEditor(MapCreator, BattleAPI):
         sprite, color, text = get_tile_info_unit(hex, state)
 
         if self.show_coords:
-            text = f"{hex.x},{hex.y}"
+            text = get_tile_info_coords(hex)
 
         return Tile(
             tile=tile,
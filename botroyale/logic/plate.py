@@ -44,6 +44,14 @@ class Plate(Hexagon):
             targets = set()
         self.targets: set[Hexagon] = targets
 
+    def copy(self) -> "Plate":
+        """Create an identical `Plate`.
+
+        Hexagons are immutable, so only the set of targets is copied. This is
+        considerably faster than `copy.deepcopy`.
+        """
+        return self._with_new_hex(self, self)
+
     def with_new_hex(self, hex: Hexagon) -> "Plate":
         """Create an identical `Plate` but with a different *hex*."""
         return self._with_new_hex(hex, self)
@@ -94,7 +102,7 @@ class Plate(Hexagon):
 
     def __hash__(self):
         """Hash."""
-        return hash(self.cube)
+        return super().__hash__()
 
     def __repr__(self):
         """Repr."""
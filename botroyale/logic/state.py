@@ -61,7 +61,7 @@ the next turn.
 from typing import Optional, Sequence, NamedTuple
 from numpy.typing import NDArray
 import numpy as np
-import copy
+import functools
 from botroyale.util.hexagon import Hexagon, ORIGIN
 from botroyale.logic.plate import Plate, PlateType
 from botroyale.logic.prng import PRNG
@@ -301,23 +301,23 @@ class State:
         if copy_last_action:
             last_action = self.last_action
             is_last_action_legal = self.is_last_action_legal
-            effects = copy.copy(self.effects)
+            effects = list(self.effects)
         else:
             last_action = None
             is_last_action_legal = False
             effects = None
         return State(
             death_radius=self.death_radius,
-            positions=copy.copy(self.positions),
-            pits=copy.copy(self.pits),
-            walls=copy.copy(self.walls),
-            plates=copy.deepcopy(self.plates),
-            alive_mask=np.copy(self.alive_mask),
-            ap=np.copy(self.ap),
-            round_ap_spent=copy.copy(self.round_ap_spent),
-            round_remaining_turns=copy.copy(self.round_remaining_turns),
-            round_done_turns=copy.copy(self.round_done_turns),
-            casualties=copy.copy(self.casualties),
+            positions=list(self.positions),
+            pits=set(self.pits),
+            walls=set(self.walls),
+            plates={p.copy() for p in self.plates},
+            alive_mask=self.alive_mask.copy(),
+            ap=self.ap.copy(),
+            round_ap_spent=list(self.round_ap_spent),
+            round_remaining_turns=list(self.round_remaining_turns),
+            round_done_turns=list(self.round_done_turns),
+            casualties=list(self.casualties),
             step_count=self.step_count,
             turn_count=self.turn_count,
             round_count=self.round_count,
@@ -395,7 +395,7 @@ class State:
     @property
     def game_over(self) -> bool:
         """If the game is over."""
-        return bool(self.alive_mask.sum() <= 1)
+        return bool(np.count_nonzero(self.alive_mask) <= 1)
 
     @property
     def winner(self) -> Optional[int]:
@@ -424,7 +424,7 @@ class State:
             declare_draw()
         ```
         """
-        if self.alive_mask.sum() == 1:
+        if np.count_nonzero(self.alive_mask) == 1:
             return np.flatnonzero(self.alive_mask)[0]
         return None
 
@@ -607,7 +607,7 @@ class State:
         for tiebreakers.
         """
         live_uids = np.flatnonzero(self.alive_mask)
-        tiebreakers = PRNG(self.seed).generate_list(self.num_of_units)
+        tiebreakers = _get_tiebreakers(self.seed, self.num_of_units)
         return sorted(
             live_uids, key=lambda uid: self.round_ap_spent[uid] + tiebreakers[uid]
         )
@@ -690,3 +690,13 @@ class State:
         self.walls |= targets
         self.pits -= targets
         self.plates -= targets
+
+
+@functools.lru_cache(maxsize=64)
+def _get_tiebreakers(seed: int, num_of_units: int) -> tuple[float, ...]:
+    """The round order tiebreakers given a seed.
+
+    These are deterministic and requested repeatedly for the same seed (e.g.
+    by `State.next_round_order` when displaying a state), hence the cache.
+    """
+    return tuple(PRNG(seed).generate_list(num_of_units))
@@ -41,7 +41,6 @@ from typing import Optional
 import subprocess
 import argparse
 from hypothesis import Verbosity as Verb
-from botroyale.util.docs import test_docs
 from botroyale.util import PROJ_DIR, PACKAGE_DIR
 
 
@@ -311,6 +310,10 @@ def _run_black(
 
 
 def _test_docs() -> bool:
+    # Imported here since the docs utility (and pdoc) is only required for this
+    # test, while this module is also imported by the unit tests' conftest.py
+    from botroyale.util.docs import test_docs
+
     print("≡≡≡≡≡ Running docs test...")
     return test_docs()
 
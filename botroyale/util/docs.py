@@ -211,9 +211,7 @@ def _module_relative_path(mod):
     full_module_name = mod.name
     module_parts = full_module_name.split(".")
     module_name = module_parts[-1]
-    file_path = Path()
-    for n in module_parts[:-1]:
-        file_path /= n
+    file_path = Path(*module_parts[:-1])
     if mod.is_package:
         file_path /= module_name
         file_path /= "index.html"
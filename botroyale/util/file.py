@@ -23,9 +23,7 @@ def toml_loads(string: str) -> dict:
 
 def file_load(file: os.PathLike) -> str:
     """Loads *file* and returns the contents as a string."""
-    with open(file, "r") as f:
-        d = f.read()
-    return d
+    return Path(file).read_text(encoding="utf-8")
 
 
 def file_dump(file: os.PathLike, d: str, clear: bool = True):
@@ -105,14 +105,19 @@ GRID_OFFSET = -1
 class Hexagon:
     """See module documentation for details."""
 
+    __slots__ = ("__cube", "__offset", "__hash")
+
     def __init__(self, q: int, r: int, s: int):
         """Initialize the class.
 
         The arguments "q", "r", and "s" are components of the cube coordinates.
         """
+        # Avoid a generator here, hexagons are created very frequently
+        assert isinstance(q, int) and isinstance(r, int) and isinstance(s, int)
         self.__cube: tuple[int, int, int] = (q, r, s)
         self.__offset: tuple[int, int] = convert_cube2offset(q, r, s)
-        assert all(isinstance(c, int) for c in self.__cube)
+        # Hexes are hashed constantly (sets, dicts, and cached methods)
+        self.__hash: int = hash(self.__cube)
         if not sum(self.__cube) == 0:
             raise ValueError(f"Cube sum must equal to 0, got: {self.__cube}")
 
@@ -130,7 +135,8 @@ class Hexagon:
         The line intersects self and neighbor. Generator values do not include
         self or neighbor. *max_distance* determines how many values to generate.
         """
-        assert neighbor in self.neighbors
+        # Cheaper than searching self.neighbors, as get_distance is cached
+        assert self.get_distance(neighbor) == 1
         dir = neighbor - self
         counter = 0
         while counter < max_distance:
@@ -238,19 +244,24 @@ class Hexagon:
         """Cube addition of hexagons. Can be used like vectors."""
         if not isinstance(other, type(self)):
             raise ValueError(f"Cannot add {type(other)} with {type(self)}")
-        return Hexagon(self.q + other.q, self.r + other.r, self.s + other.s)
+        # Unpack the cubes directly rather than through 6 property lookups
+        q, r, s = self.__cube
+        dq, dr, ds = other.__cube
+        return Hexagon(q + dq, r + dr, s + ds)
 
     def __sub__(self, other: "Hexagon") -> "Hexagon":
         """Cube subtraction of hexagons. Can be used like vectors."""
         if not isinstance(other, type(self)):
             raise ValueError(f"Cannot subtract {type(other)} with {type(self)}")
-        return Hexagon(self.q - other.q, self.r - other.r, self.s - other.s)
+        q, r, s = self.__cube
+        dq, dr, ds = other.__cube
+        return Hexagon(q - dq, r - dr, s - ds)
 
     def __eq__(self, other: "Hexagon") -> bool:
         """Returns if self and other share coordinates."""
         if not isinstance(other, type(self)):
             return False
-        return self.cube == other.cube
+        return self.__cube == other.__cube
 
     @classmethod
     def round_(cls, fq: float, fr: float, fs: float) -> "Hexagon":
@@ -353,7 +364,7 @@ class Hexagon:
 
     def __hash__(self):
         """Hash."""
-        return hash(self.cube)
+        return self.__hash
 
 
 # Common Hexagon getters
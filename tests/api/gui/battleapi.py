@@ -1,5 +1,6 @@
 # flake8: noqa
 
+import pytest
 from hypothesis import given, strategies as st
 from tests.hexagon import st_hex
 from botroyale.api.gui import BattleAPI, Control, InputWidget, Tile
@@ -66,6 +67,19 @@ def test_get_gui_tile_info(api, hex):
     assert isinstance(tile, Tile)
 
 
+def test_tile_equality():
+    assert Tile() == Tile()
+    assert hash(Tile()) == hash(Tile())
+    assert Tile(text="a") != Tile(text="b")
+
+
+@given(st_api, st_hex)
+def test_get_gui_tile_info_immutable(api, hex):
+    tile = api.get_gui_tile_info(hex)
+    with pytest.raises(AttributeError):
+        tile.text = "changed"
+
+
 @given(st_api)
 def test_get_map_size_hint(api):
     size_hint = api.get_map_size_hint()
@@ -0,0 +1,28 @@
+# flake8: noqa
+
+from hypothesis import given, strategies as st
+from botroyale.api.logging import Logger
+
+
+@given(st.booleans(), st.booleans())
+def test_set_logging_temp(initial, temp):
+    original = Logger.enable_logging
+    Logger.enable_logging = initial
+    with Logger.set_logging_temp(temp) as last_state:
+        assert last_state is initial
+        assert Logger.enable_logging is temp
+    assert Logger.enable_logging is initial
+    Logger.enable_logging = original
+
+
+@given(st.booleans(), st.booleans())
+def test_set_logging_temp_restores_on_error(initial, temp):
+    original = Logger.enable_logging
+    Logger.enable_logging = initial
+    try:
+        with Logger.set_logging_temp(temp):
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert Logger.enable_logging is initial
+    Logger.enable_logging = original
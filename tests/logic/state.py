@@ -7,6 +7,7 @@ from botroyale.util.hexagon import Hexagon
 from botroyale.api.actions import Idle, Move, Jump, Push
 from botroyale.logic.state import State
 from botroyale.logic.plate import Plate
+from botroyale.logic import get_tile_info_unit, get_unit_index
 
 
 st_plate = st.builds(
@@ -47,6 +48,24 @@ def test_make_plate(plate):
     assert isinstance(plate, Hexagon)
 
 
+@given(st_plate, st_hex)
+def test_plate_copy(plate, new_target):
+    pressure = plate.pressure
+    targets = set(plate.targets)
+    plate_copy = plate.copy()
+    assert plate_copy == plate
+    assert plate_copy.plate_type == plate.plate_type
+    assert plate_copy.pressure == plate.pressure
+    assert plate_copy.min_pressure == plate.min_pressure
+    assert plate_copy.pressure_reset == plate.pressure_reset
+    assert plate_copy.targets == plate.targets
+    plate_copy.pressure -= 1
+    plate_copy.targets.add(new_target)
+    plate_copy.targets.clear()
+    assert plate.pressure == pressure
+    assert plate.targets == targets
+
+
 @given(st_state)
 @settings(suppress_health_check=[HealthCheck.data_too_large])  # State has too many possible permutations
 def test_make_state(state):
@@ -58,6 +77,19 @@ def test_make_state(state):
     assert sum(state.alive_mask) >= 2
 
 
+@given(st_state, st_hex)
+@settings(suppress_health_check=[HealthCheck.data_too_large])  # State has too many possible permutations
+def test_tile_info_unit_index(state, hex):
+    unit_index = get_unit_index(state)
+    assert sorted(uid for uids in unit_index.values() for uid in uids) == list(
+        range(state.num_of_units)
+    )
+    for pos in [hex, *state.positions]:
+        assert get_tile_info_unit(pos, state, unit_index=unit_index) == (
+            get_tile_info_unit(pos, state)
+        )
+
+
 @given(st_state)
 @settings(suppress_health_check=[HealthCheck.data_too_large])  # State has too many possible permutations
 def test_increment_round(state):